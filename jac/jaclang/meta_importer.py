@@ -28,11 +28,20 @@ from jaclang.jac0core import ext_registry  # noqa: E402
 from jaclang.jac0core.cache_paths import get_bootstrap_cache_dir  # noqa: E402
 
 _jac0_source_path = getattr(_jac0_mod, "__file__", "")
-_jac0_hash = (
-    hashlib.sha256(Path(_jac0_source_path).read_bytes()).digest()
-    if _jac0_source_path and os.path.isfile(_jac0_source_path)
-    else b""
-)
+_jac0_hash: bytes | None = None
+
+
+def _get_jac0_hash() -> bytes:
+    """Digest of the jac0 transpiler source, read on first cache miss only."""
+    global _jac0_hash
+    if _jac0_hash is None:
+        _jac0_hash = (
+            hashlib.sha256(Path(_jac0_source_path).read_bytes()).digest()
+            if _jac0_source_path and os.path.isfile(_jac0_source_path)
+            else b""
+        )
+    return _jac0_hash
+
 
 # Inline logging config (previously in jaclang.jac0core.log)
 logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
@@ -51,28 +60,154 @@ logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
 # Jac modules are bootstrapped), so it shares one platform-resolution rule with
 # `jaclang.jac0core.jir`; the cache *key*, however, stays independent of that
 # module's `compute_module_key` since it must work before jac0core compiles.
+#
+# Computing that digest means reading and hashing every jac0core source on
+# every start.  A stat manifest next to the cache records, per bootstrap
+# file, the digest together with (size, mtime_ns, inode) of each input: the
+# file, its impl files, the directories impl discovery looks in (so added or
+# removed impls show up as a directory change) and jac0.py.  While those stats
+# are unchanged the recorded digest is reused and no source is read.
+# `JAC_BOOTSTRAP_CACHE` selects how far the manifest is trusted:
+#   stat    (default) reuse the digest while every input's stats match
+#   frozen  reuse it without stat-ing -- for installs whose sources never
+#           change; delete the manifest to force a recheck
+#   hash    ignore the manifest and hash every source (the previous behaviour)
 # ---------------------------------------------------------------------------
 
+_MISSING_STAT = (-1, -1, -1)
 
-def _bootstrap_compile(
-    file_path: str,
-    jac_source: str,
-    impl_sources: list[tuple[str, str]] | None = None,
-) -> types.CodeType:
-    """Compile a bootstrap .jac file, using a marshalled bytecode disk cache."""
-    # Build the hash key from all source inputs + Python version + transpiler.
+
+def _bootstrap_cache_mode() -> str:
+    """Return the JAC_BOOTSTRAP_CACHE mode: "stat", "frozen" or "hash"."""
+    mode = os.environ.get("JAC_BOOTSTRAP_CACHE", "").strip().lower()
+    return mode if mode in ("stat", "frozen", "hash") else "stat"
+
+
+def _stat_key(path: str) -> tuple[int, int, int]:
+    """(size, mtime_ns, inode) of `path`, or a sentinel if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return _MISSING_STAT
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def _bootstrap_inputs(file_path: str, impl_paths: list[str]) -> list[str]:
+    """Every path whose change can alter the bootstrap digest of `file_path`."""
+    dir_path = os.path.dirname(file_path)
+    base = file_path[: -len(".jac")]
+    impl_folder = ext_registry.ANNEX_FOLDER[ext_registry.IMPL_SUFFIX]
+    return [
+        file_path,
+        *impl_paths,
+        dir_path,
+        os.path.join(dir_path, "impl"),
+        base + impl_folder,
+        _jac0_source_path,
+    ]
+
+
+class _BootstrapManifest:
+    """Stat manifest: bootstrap source path -> (digest, [(input, stat), ...]).
+
+    Stored as one marshalled dict per Python build.  Entries are only added
+    or replaced, and every write re-reads the file first, so concurrent
+    processes at worst drop each other's update and rehash once more.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Bind to the manifest at `path`; it is read on first lookup."""
+        self.path = path
+        self._entries: dict | None = None
+
+    def _load(self) -> dict:
+        """Read the manifest from disk; a missing or corrupt file reads empty."""
+        try:
+            entries = marshal.loads(self.path.read_bytes())  # noqa: S302
+        except Exception:
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def lookup(self, file_path: str, trust: bool = False) -> str | None:
+        """Return the recorded digest if `file_path`'s inputs are unchanged.
+
+        With `trust`, any recorded digest is returned without stat-ing.
+        """
+        if self._entries is None:
+            self._entries = self._load()
+        entry = self._entries.get(file_path)
+        if entry is None:
+            return None
+        digest, inputs = entry
+        if not trust:
+            for path, stat in inputs:
+                if _stat_key(path) != tuple(stat):
+                    return None
+        return digest
+
+    def record(self, file_path: str, digest: str, inputs: list) -> None:
+        """Store `file_path`'s digest with the input stats taken before hashing."""
+        entries = self._load()
+        entries[file_path] = (digest, inputs)
+        self._entries = entries
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                tmp.write_bytes(marshal.dumps(entries))
+                os.replace(tmp, self.path)
+            finally:
+                tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+_bootstrap_manifest: _BootstrapManifest | None = None
+
+
+def _get_bootstrap_manifest() -> _BootstrapManifest:
+    """Process-wide manifest, one file per Python build."""
+    global _bootstrap_manifest
+    if _bootstrap_manifest is None:
+        tag = hashlib.sha256(sys.version.encode()).hexdigest()[:12]
+        _bootstrap_manifest = _BootstrapManifest(
+            get_bootstrap_cache_dir() / f"manifest.{tag}.marshal"
+        )
+    return _bootstrap_manifest
+
+
+def _bootstrap_digest(
+    jac_source: str, impl_sources: list[tuple[str, str]] | None = None
+) -> str:
+    """Content digest naming the bootstrap cache file for one module."""
     h = hashlib.sha256()
     h.update(sys.version.encode())
-    h.update(_jac0_hash)
+    h.update(_get_jac0_hash())
     h.update(jac_source.encode())
     if impl_sources:
         for src, path in impl_sources:
             h.update(path.encode())
             h.update(src.encode())
-    digest = h.hexdigest()[:16]
+    return h.hexdigest()[:16]
+
 
+def _bootstrap_cache_file(file_path: str, digest: str) -> Path:
+    """Marshalled-bytecode cache file for `file_path` at `digest`."""
     base_name = os.path.splitext(os.path.basename(file_path))[0]
-    cache_file = get_bootstrap_cache_dir() / f"{base_name}.{digest}.jbc"
+    return get_bootstrap_cache_dir() / f"{base_name}.{digest}.jbc"
+
+
+def _bootstrap_compile(
+    file_path: str,
+    jac_source: str,
+    impl_sources: list[tuple[str, str]] | None = None,
+    digest: str | None = None,
+) -> types.CodeType:
+    """Compile a bootstrap .jac file, using a marshalled bytecode disk cache."""
+    # The key covers all source inputs + Python version + transpiler.
+    if digest is None:
+        digest = _bootstrap_digest(jac_source, impl_sources)
+    cache_file = _bootstrap_cache_file(file_path, digest)
 
     if cache_file.is_file():
         try:
@@ -99,13 +234,48 @@ def _bootstrap_compile(
     return code
 
 
+def _load_bootstrap(
+    file_path: str,
+    with_impls: bool = True,
+    manifest: _BootstrapManifest | None = None,
+) -> types.CodeType:
+    """Return the code for a bootstrap .jac file, reading sources only on a miss."""
+    mode = _bootstrap_cache_mode()
+    if mode == "hash":
+        manifest = None
+    elif manifest is None:
+        manifest = _get_bootstrap_manifest()
+    if manifest is not None:
+        digest = manifest.lookup(file_path, trust=mode == "frozen")
+        if digest is not None:
+            try:
+                cache_file = _bootstrap_cache_file(file_path, digest)
+                return marshal.loads(cache_file.read_bytes())  # noqa: S302
+            except Exception:
+                pass
+
+    impl_paths = _jac0_discover_impls(file_path) if with_impls else []
+    # Stat before reading: an edit racing this call then fails the next check.
+    inputs = [(p, _stat_key(p)) for p in _bootstrap_inputs(file_path, impl_paths)]
+    with open(file_path, encoding="utf-8") as f:
+        jac_source = f.read()
+    impl_sources: list[tuple[str, str]] = []
+    for impl_path in impl_paths:
+        with open(impl_path, encoding="utf-8") as f:
+            impl_sources.append((f.read(), impl_path))
+    digest = _bootstrap_digest(jac_source, impl_sources or None)
+    code = _bootstrap_compile(file_path, jac_source, impl_sources or None, digest)
+    if manifest is not None:
+        manifest.record(file_path, digest, inputs)
+    return code
+
+
 # Bootstrap modresolver.jac with jac0 before JacMetaImporter is registered.
 # This module must be available for find_spec()/get_code(), but normal
 # .jac imports are not yet operational at this point.
 _jac0core_dir = os.path.join(os.path.dirname(__file__), "jac0core")
 _modresolver_jac = os.path.join(_jac0core_dir, "modresolver.jac")
-with open(_modresolver_jac, encoding="utf-8") as _f:
-    _modresolver_code = _bootstrap_compile(_modresolver_jac, _f.read())
+_modresolver_code = _load_bootstrap(_modresolver_jac, with_impls=False)
 _modresolver = types.ModuleType("jaclang.jac0core.modresolver")
 _modresolver.__file__ = _modresolver_jac
 _modresolver.__package__ = "jaclang.jac0core"
@@ -199,15 +369,7 @@ class JacMetaImporter(importlib.abc.MetaPathFinder, importlib.abc.Loader):
         They are compiled with the lightweight jac0 transpiler rather than
         the full Jac compiler, which depends on them.
         """
-        with open(file_path, encoding="utf-8") as f:
-            jac_source = f.read()
-
-        impl_sources: list[tuple[str, str]] = []
-        for impl_path in _jac0_discover_impls(file_path):
-            with open(impl_path, encoding="utf-8") as f:
-                impl_sources.append((f.read(), impl_path))
-
-        code = _bootstrap_compile(file_path, jac_source, impl_sources or None)
+        code = _load_bootstrap(file_path)
         exec(code, module.__dict__)
 
     def exec_module(self, module: ModuleType) -> None: